@@ -191,6 +191,7 @@ def main(argv=None) -> None:
                 color_print("ERROR", f"Failed {sp.name}: {e}")
                 log_trace(e)
                 results.append(f"{sp.name}: failed - {e}")
+        pipeline.close()
         (folder / "batch_summary.txt").write_text("\n".join(results))
         color_print("SUCCESS", "Batch processing complete")
         return
@@ -208,6 +209,8 @@ def main(argv=None) -> None:
         color_print("ERROR", f"Pipeline failed: {exc}")
         log_trace(exc)
         return
+    finally:
+        pipeline.close()
 
     paths = [ctx.voiceover_path, ctx.final_video_path]
     if not args.no_subtitles:
@@ -12,6 +12,7 @@ import os
 class Config:
     """Application configuration loaded from ``config.json``."""
     subtitle_style: str = "simple"
+    subtitle_font_file: str | None = None
     watermark_path: str | None = None
     watermark_opacity: float = 1.0
     watermark_enabled: bool = True
@@ -22,12 +23,15 @@ class Config:
     background_videos_path: str = "assets/backgrounds"
     resolution: str = "1080x1920"
     ffmpeg_path: str = "ffmpeg"
+    hardware_encoding: bool = True
     log_file: str = "./logs/clipjar.log"
     step_timeout: int = 120
     safe_mode: bool = False
     developer_mode: bool = False
     voices: dict[str, str] | None = None
     background_styles: dict[str, str] | None = None
+    background_urls: dict[str, list[str]] | None = None
+    background_cache_dir: str = "~/.cache/clipjar/bg"
     resolutions: list[str] | None = None
     presets: dict[str, dict] | None = None
     default_preset: str = "default"
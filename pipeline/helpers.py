@@ -1,19 +1,37 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Callable, Any
+from typing import Optional, Any, Awaitable
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import hashlib
 import json
+import os
 import re
 import shutil
-import threading
 import traceback
 import wave
 import subprocess
+import tempfile
+import zipfile
+from urllib.parse import urlparse
+try:
+    import requests
+except Exception:  # pragma: no cover - optional dependency
+    requests = None
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+_UNSAFE_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+MAX_NAME_LENGTH = 128
 
 
 def sanitize_name(name: str) -> str:
     """Return a filesystem-safe version of *name*."""
-    cleaned = re.sub(r"[^a-zA-Z0-9_-]", "_", name.strip())
+    cleaned = _UNSAFE_CHARS.sub("_", name.strip()[:MAX_NAME_LENGTH])
     return cleaned or "session"
 
 
@@ -30,35 +48,117 @@ def sanitize_filename(name: str) -> str:
     return sanitize_name(name)
 
 
+def write_json(path: Path, data: Any) -> None:
+    """Write *data* to *path* as indented JSON in a single write."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        path.write_text(json.dumps(data, indent=2, default=str))
+
+
+# media payloads are already compressed; deflating them again only burns CPU
+STORED_SUFFIXES = {".mp4", ".webm", ".mp3", ".m4a", ".opus", ".png", ".jpg"}
+
+
 def zip_folder(folder: Path, dest_zip: Path) -> Path:
-    """Create a zip archive of *folder* at *dest_zip* (without extension)."""
+    """Create a zip archive of *folder* at *dest_zip* (without extension).
+
+    Already-compressed media is stored as-is and file contents are streamed
+    in 1 MiB blocks rather than read through small Python buffers.
+    """
     if not folder.exists():
         raise FileNotFoundError(f"Folder not found: {folder}")
     dest_zip = dest_zip.with_suffix(".zip")
-    base = dest_zip.with_suffix("")
-    shutil.make_archive(str(base), "zip", root_dir=folder)
+    with zipfile.ZipFile(dest_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(folder.rglob("*")):
+            arcname = path.relative_to(folder).as_posix()
+            info = zipfile.ZipInfo.from_file(path, arcname)
+            if path.is_dir():
+                zf.writestr(info, b"")
+                continue
+            if path.suffix.lower() in STORED_SUFFIXES:
+                info.compress_type = zipfile.ZIP_STORED
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+            with open(path, "rb") as src, zf.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
     return dest_zip
 
 
-def run_with_timeout(func: Callable[..., Any], timeout: float, *args, **kwargs) -> Any:
-    """Run *func* with timeout. Raises TimeoutError if timeout exceeded."""
-    result: dict[str, Any] = {}
-    exc: list[BaseException] = []
+# Keyword arguments for launching ffmpeg/ffprobe. With ``close_fds=False`` and
+# an absolute executable path CPython can use posix_spawn instead of
+# fork+exec, which is much cheaper once a large TTS/Whisper model is loaded.
+# This is safe because Python creates descriptors non-inheritable (PEP 446);
+# only fds explicitly marked inheritable would leak into the child.
+FAST_SPAWN: dict[str, Any] = {"close_fds": False}
 
-    def target() -> None:
-        try:
-            result["value"] = func(*args, **kwargs)
-        except BaseException as e:  # capture all
-            exc.append(e)
 
-    thread = threading.Thread(target=target)
-    thread.start()
-    thread.join(timeout)
-    if thread.is_alive():
-        raise TimeoutError(f"{func.__name__} timed out after {timeout}s")
-    if exc:
-        raise exc[0]
-    return result.get("value")
+@lru_cache(maxsize=None)
+def resolve_executable(name: str) -> Optional[str]:
+    """Return the absolute path of executable *name*, cached per process."""
+    return shutil.which(name)
+
+
+async def await_with_timeout(aw: Awaitable[Any], timeout: float, name: str) -> Any:
+    """Await *aw*, raising TimeoutError if it takes longer than *timeout*."""
+    try:
+        return await asyncio.wait_for(aw, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"{name} timed out after {timeout}s") from None
+
+
+async def run_process_async(cmd: list[str], timeout: Optional[float] = None) -> tuple[str, str]:
+    """Run *cmd* and return its decoded ``(stdout, stderr)``.
+
+    The child is killed if *timeout* expires or the awaiting task is
+    cancelled. Raises ``subprocess.CalledProcessError`` on a non-zero exit.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **FAST_SPAWN
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+        proc.kill()
+        await proc.wait()
+        if isinstance(e, asyncio.TimeoutError):
+            raise TimeoutError(f"{cmd[0]} timed out after {timeout}s") from None
+        raise
+    stdout = out.decode(errors="replace")
+    stderr = err.decode(errors="replace")
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+    return stdout, stderr
+
+
+def download_cached(url: str, cache_dir: Path) -> Path:
+    """Download *url* into *cache_dir* unless a cached copy already exists.
+
+    Files are named by the SHA-256 of the URL and written via a temporary
+    ``.part`` file so concurrent runs never see a partial download.
+    """
+    suffix = Path(urlparse(url).path).suffix.lower()
+    if suffix not in {".mp4", ".webm"}:
+        suffix = ".mp4"
+    dest = cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}{suffix}"
+    if dest.exists():
+        return dest
+    if requests is None:
+        raise RuntimeError("requests library not available")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with requests.get(url, stream=True, timeout=30) as resp:
+        resp.raise_for_status()
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".part", delete=False) as f:
+            part = Path(f.name)
+            try:
+                for chunk in resp.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+            except BaseException:
+                f.close()
+                part.unlink(missing_ok=True)
+                raise
+    part.replace(dest)
+    return dest
 
 
 def create_silence(path: Path, duration: float = 1.0) -> None:
@@ -99,6 +199,8 @@ class PipelineContext:
     script_path: Path = field(init=False)
     log_file: Optional[Path] = None
     debug: bool = False
+    has_subtitles: bool = True
+    subtitle_words: list[dict] = field(default_factory=list)
     timestamp: str = field(default_factory=iso_timestamp)
 
     def __post_init__(self):
@@ -119,8 +221,7 @@ class PipelineContext:
             "timestamp": self.timestamp,
             "status": status,
         }
-        with open(self.output_dir / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        write_json(self.output_dir / "metadata.json", metadata)
 
     def write_summary(self):
         summary = (
@@ -141,8 +242,7 @@ class PipelineContext:
         (self.output_dir / "error_trace.txt").write_text(trace)
 
     def save_config_snapshot(self, config: dict) -> None:
-        with open(self.output_dir / "session_config.json", "w") as f:
-            json.dump(config, f, indent=2)
+        write_json(self.output_dir / "session_config.json", config)
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +285,21 @@ def validate_files(*paths: Path) -> list[Path]:
     return missing
 
 
+WAV_HEADER_SIZE = 44
+
+
+def is_valid_wav(path: Path) -> bool:
+    """Return ``True`` if *path* has a RIFF/WAVE header followed by audio data."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= WAV_HEADER_SIZE:
+                return False
+            header = f.read(12)
+    except OSError:
+        return False
+    return header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+
+
 def preview_voice(engine: str, voice_id: str, coqui_model: str) -> Path:
     """Generate and play a short voice preview."""
     from .voiceover import VoiceOverGenerator
@@ -207,12 +322,18 @@ def preview_voice(engine: str, voice_id: str, coqui_model: str) -> Path:
 
 def trim_silence_ffmpeg(audio: Path, ffmpeg: str = "ffmpeg") -> None:
     """Trim leading and trailing silence from *audio* using ffmpeg."""
-    if not shutil.which(ffmpeg):
+    asyncio.run(trim_silence_ffmpeg_async(audio, ffmpeg))
+
+
+async def trim_silence_ffmpeg_async(audio: Path, ffmpeg: str = "ffmpeg") -> None:
+    """Async variant of :func:`trim_silence_ffmpeg`."""
+    exe = resolve_executable(ffmpeg)
+    if not exe:
         color_print("ERROR", f"ffmpeg not found: {ffmpeg}")
         return
     trimmed = audio.with_name(audio.stem + "_trim.wav")
     cmd = [
-        ffmpeg,
+        exe,
         "-y",
         "-i",
         str(audio),
@@ -221,7 +342,7 @@ def trim_silence_ffmpeg(audio: Path, ffmpeg: str = "ffmpeg") -> None:
         str(trimmed),
     ]
     try:
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        await run_process_async(cmd)
         if trimmed.exists() and trimmed.stat().st_size > 0:
             audio.unlink(missing_ok=True)
             trimmed.rename(audio)
@@ -231,7 +352,8 @@ def trim_silence_ffmpeg(audio: Path, ffmpeg: str = "ffmpeg") -> None:
 
 def validate_video(path: Path, subtitles_required: bool = True, ffprobe: str = "ffprobe") -> dict:
     """Return basic validation info for *path*."""
-    if not shutil.which(ffprobe):
+    exe = resolve_executable(ffprobe)
+    if not exe:
         return {
             "exists": False,
             "duration": False,
@@ -253,10 +375,11 @@ def validate_video(path: Path, subtitles_required: bool = True, ffprobe: str = "
         return info
     try:
         result = subprocess.run(
-            [ffprobe, "-v", "error", "-show_entries", "format=duration,size", "-show_streams", "-of", "json", str(path)],
+            [exe, "-v", "error", "-show_entries", "format=duration,size", "-show_streams", "-of", "json", str(path)],
             check=True,
             capture_output=True,
             text=True,
+            **FAST_SPAWN,
         )
         data = json.loads(result.stdout)
         fmt = data.get("format", {})
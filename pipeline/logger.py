@@ -1,23 +1,26 @@
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+# loggers that write into a pipeline session's log file
+SESSION_LOGGERS = ("pipeline", "voiceover", "subtitles", "renderer")
+
 
 def setup_logger(name: str, log_file: Path | None = None, debug: bool = False) -> logging.Logger:
     """Return a configured logger writing to console and optional *log_file*."""
     logger = logging.getLogger(name)
     level = logging.DEBUG if debug else logging.INFO
     logger.setLevel(level)
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    formatter = logging.Formatter(LOG_FORMAT)
 
-    if not logger.handlers:
+    # FileHandler subclasses StreamHandler, so a session or file handler
+    # attached earlier must not count as the console handler
+    if not any(type(h) is logging.StreamHandler for h in logger.handlers):
         ch = logging.StreamHandler()
         ch.setFormatter(formatter)
         logger.addHandler(ch)
-    else:
-        if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
-            ch = logging.StreamHandler()
-            ch.setFormatter(formatter)
-            logger.addHandler(ch)
 
     if log_file:
         log_file = Path(log_file)
@@ -27,3 +30,62 @@ def setup_logger(name: str, log_file: Path | None = None, debug: bool = False) -
             logger.addHandler(fh)
 
     return logger
+
+
+def start_queue_logging(log_file: Path) -> tuple[QueueHandler, QueueListener]:
+    """Return a queue handler feeding a rotating *log_file* on a background thread."""
+    fh = RotatingFileHandler(log_file, maxBytes=10 << 20, backupCount=5)
+    fh.setFormatter(
+        logging.Formatter(
+            "%(asctime)s - %(levelname)s - [%(session)s] %(message)s",
+            defaults={"session": "-"},
+        )
+    )
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, fh, respect_handler_level=True)
+    listener.start()
+    handler = QueueHandler(log_queue)
+    for name in SESSION_LOGGERS:
+        logging.getLogger(name).addHandler(handler)
+    return handler, listener
+
+
+def stop_queue_logging(handler: QueueHandler, listener: QueueListener) -> None:
+    """Detach *handler* and flush the rotating log behind *listener*."""
+    for name in SESSION_LOGGERS:
+        logging.getLogger(name).removeHandler(handler)
+    listener.stop()
+    for h in listener.handlers:
+        h.close()
+
+
+class SessionFilter(logging.Filter):
+    """Tag records with the name of the session being processed."""
+
+    def __init__(self, session: str) -> None:
+        super().__init__()
+        self.session = session
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session = self.session
+        return True
+
+
+class SessionLog:
+    """Tee the pipeline loggers into a per-session *log_file* until detached."""
+
+    def __init__(self, log_file: Path, session: str) -> None:
+        self.handler = logging.FileHandler(log_file)
+        self.handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.filter = SessionFilter(session)
+        for name in SESSION_LOGGERS:
+            logger = logging.getLogger(name)
+            logger.addFilter(self.filter)
+            logger.addHandler(self.handler)
+
+    def detach(self) -> None:
+        for name in SESSION_LOGGERS:
+            logger = logging.getLogger(name)
+            logger.removeFilter(self.filter)
+            logger.removeHandler(self.handler)
+        self.handler.close()
@@ -1,24 +1,39 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable
+import asyncio
+import subprocess
 import time
-import json
 from .helpers import (
     PipelineContext,
     sanitize_name,
     now_ts_folder,
-    run_with_timeout,
-    create_silence,
-    create_dummy_subtitles,
+    await_with_timeout,
+    resolve_executable,
+    download_cached,
+    is_valid_wav,
     log_trace,
+    write_json,
 )
-from .voiceover import VoiceOverGenerator
+from .voiceover import VoiceOverGenerator, release_coqui_models
 from .subtitles import SubtitleGenerator
-from .renderer import VideoRenderer
-from .logger import setup_logger
+from .renderer import VideoRenderer, detect_hw_encoder
+from .logger import SessionLog, setup_logger, start_queue_logging, stop_queue_logging
 from .config import Config
 
 
+OUTPUT_ROOT = Path("output")
+# characters of a failed subprocess's stderr included in the error log
+STDERR_TAIL = 2000
+# concurrent background downloads; kept off the stage pool so network
+# waits never hold up voiceover, transcription or rendering
+DOWNLOAD_WORKERS = 4
+
+
 class VideoPipeline:
     """Orchestrates the voiceover, subtitles and rendering steps."""
 
@@ -26,10 +41,53 @@ class VideoPipeline:
         self.config = config
         log_file = Path(log_file or config.log_file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        self.logger = setup_logger("pipeline", log_file, debug)
+        self.logger = setup_logger("pipeline", None, debug)
+        # one process-wide rotating log written from a background thread
+        self._log_handler, self._log_listener = start_queue_logging(log_file)
+        self._session_log: SessionLog | None = None
         self.debug = debug
         self.log_file = log_file
+        self.config.validate(self.logger)
         self.timeout = config.step_timeout
+        # paths derived from the validated config, built once per pipeline
+        self._bg_path = Path(config.background_videos_path)
+        self._watermark_path = (
+            Path(config.watermark_path)
+            if config.watermark_enabled and config.watermark_path
+            else None
+        )
+        self._subtitle_font = (
+            Path(config.subtitle_font_file) if config.subtitle_font_file else None
+        )
+        self._ffmpeg_path = resolve_executable(config.ffmpeg_path) or config.ffmpeg_path
+        self._hw_encoder = (
+            detect_hw_encoder(self._ffmpeg_path) if config.hardware_encoding else None
+        )
+        self._bg_styles_ci = {
+            k.casefold(): Path(v) for k, v in (config.background_styles or {}).items()
+        }
+        self._bg_urls_ci = {
+            k.casefold(): list(v) for k, v in (config.background_urls or {}).items()
+        }
+        self._bg_cache = Path(config.background_cache_dir).expanduser()
+        self._executor = ThreadPoolExecutor(max_workers=3)
+        self._download_executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+        # generators keep their loaded TTS/Whisper models between runs; voices
+        # using the same Coqui model share one copy of it
+        self._voice_cache: dict[tuple, VoiceOverGenerator] = {}
+        self._subs_cache: dict[str | None, SubtitleGenerator] = {}
+
+    def close(self) -> None:
+        """Release cached models and shut down the worker pools."""
+        for gen in [*self._voice_cache.values(), *self._subs_cache.values()]:
+            gen.close()
+        self._voice_cache.clear()
+        self._subs_cache.clear()
+        release_coqui_models()
+        self._executor.shutdown(wait=True)
+        # abandoned downloads are not waited for
+        self._download_executor.shutdown(wait=False, cancel_futures=True)
+        stop_queue_logging(self._log_handler, self._log_listener)
 
     # ------------------------------------------------------------------
     # private helpers
@@ -43,9 +101,7 @@ class VideoPipeline:
         output: Path | None,
         force_coqui: bool,
     ) -> tuple[PipelineContext, Path]:
-        """Validate config and return a context and background folder."""
-
-        self.config.validate(self.logger)
+        """Return a context and background folder for this run."""
 
         style = self.config.subtitle_style
         engine = self.config.voice_engine
@@ -53,20 +109,17 @@ class VideoPipeline:
         if force_coqui:
             engine = "coqui"
 
-        bg_styles = self.config.background_styles or {}
-        bg_folder = Path(self.config.background_videos_path)
+        # remote styles render from their prefetched videos when available
+        bg_folder = self._bg_path
         if background:
-            for key, val in bg_styles.items():
-                if key.lower() == background.lower():
-                    bg_folder = Path(val)
-                    break
+            bg_folder = self._bg_styles_ci.get(background.casefold(), bg_folder)
 
         title = sanitize_name(script_name if script_name not in {"cli", "stdin"} else "session")
         if output:
             final_output = Path(output)
             out_dir = final_output.parent
         else:
-            out_dir = Path("output") / f"{title}_{now_ts_folder()}"
+            out_dir = OUTPUT_ROOT / f"{title}_{now_ts_folder()}"
             final_output = out_dir / "final_video.mp4"
         session_log = out_dir / "pipeline.log"
 
@@ -82,56 +135,118 @@ class VideoPipeline:
         )
         ctx.final_video_path = final_output
 
-        setup_logger("pipeline", session_log, self.debug)
+        self._session_log = SessionLog(session_log, title)
         return ctx, bg_folder
 
-    def _download_media(self, ctx: PipelineContext) -> None:
-        """Download any required media assets.
+    def _in_thread(self, func: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """Run blocking *func* on the pipeline's worker pool."""
 
-        Currently a no-op placeholder that can be extended to pull remote
-        resources using :class:`Downloader`.
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _download_media(self, background: str | None) -> list[Path]:
+        """Prefetch the remote background videos configured for *background*.
+
+        Videos listed in ``config.background_urls`` are fetched into the shared
+        background cache, keyed by URL so styles sharing a URL reuse one copy.
+        Returns the cached paths of the currently configured URLs; an empty
+        list means the renderer uses the local background folder.
         """
 
-        # Intentionally left blank - to be implemented as needed
-        return None
+        urls = self._bg_urls_ci.get(background.casefold(), []) if background else []
+        if not urls:
+            return []
+        self.logger.info(f"Prefetching {len(urls)} background video(s)")
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    self._download_executor, download_cached, url, self._bg_cache
+                )
+                for url in urls
+            ],
+            return_exceptions=True,
+        )
+        videos = []
+        for url, res in zip(urls, results):
+            if isinstance(res, BaseException):
+                self.logger.warning(f"Background download failed for {url}: {res}")
+            else:
+                videos.append(res)
+        if not videos:
+            self.logger.warning(f"No background videos downloaded for '{background}'")
+        return videos
+
+    def _voice_generator(self, ctx: PipelineContext, force_coqui: bool) -> VoiceOverGenerator:
+        """Return a cached :class:`VoiceOverGenerator` for *ctx*."""
+
+        key = (ctx.voice_engine, ctx.voice_id, self.config.coqui_model_name, force_coqui)
+        voice = self._voice_cache.get(key)
+        if voice is None:
+            voice = VoiceOverGenerator(
+                ctx.voice_engine,
+                ctx.voice_id,
+                self.config.coqui_model_name,
+                force_coqui=force_coqui,
+                debug=self.debug,
+            )
+            self._voice_cache[key] = voice
+        return voice
+
+    def _subtitle_generator(self, ctx: PipelineContext) -> SubtitleGenerator:
+        """Return a cached :class:`SubtitleGenerator` for the configured model."""
+
+        model = self.config.whisper_model
+        subs = self._subs_cache.get(model)
+        if subs is None:
+            subs = SubtitleGenerator(
+                ctx.subtitle_style,
+                model=model,
+                debug=self.debug,
+            )
+            self._subs_cache[model] = subs
+        else:
+            subs.style = ctx.subtitle_style
+        return subs
 
-    def _generate_voiceover(self, ctx: PipelineContext, force_coqui: bool, trim_silence: bool) -> None:
+    async def _generate_voiceover(self, ctx: PipelineContext, force_coqui: bool, trim_silence: bool) -> None:
         """Generate the voiceover audio file for *ctx*."""
 
         self.logger.info("[1/3] Voiceover generation")
-        voice = VoiceOverGenerator(
-            ctx.voice_engine,
-            ctx.voice_id,
-            self.config.coqui_model_name,
-            force_coqui=force_coqui,
-            debug=self.debug,
-            log_file=ctx.log_file,
-        )
+        voice = self._voice_generator(ctx, force_coqui)
         try:
-            run_with_timeout(
-                lambda: voice.generate(ctx.script_text, ctx.voiceover_path),
+            await await_with_timeout(
+                self._in_thread(voice.generate, ctx.script_text, ctx.voiceover_path),
                 self.timeout,
+                "voiceover",
             )
-            if not ctx.voiceover_path.exists() or ctx.voiceover_path.stat().st_size == 0:
+            if not is_valid_wav(ctx.voiceover_path):
                 raise RuntimeError("voiceover file invalid")
-        except Exception as e:
-            self.logger.error(f"Voiceover step failed: {e}")
-            if self.config.developer_mode:
-                create_silence(ctx.voiceover_path)
-                self.logger.warning("Developer mode: using silent audio")
-            else:
+        except TimeoutError as e:
+            self.logger.error("Voiceover step timed out: %s", e)
+            if not self.config.developer_mode:
+                raise
+            self._silent_voiceover(ctx)
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            self._log_step_failure("Voiceover", e)
+            if not self.config.developer_mode:
                 raise
+            self._silent_voiceover(ctx)
 
         if trim_silence:
             self.logger.info("Trimming silence from voiceover")
             try:
-                from .helpers import trim_silence_ffmpeg
+                from .helpers import trim_silence_ffmpeg_async
 
-                trim_silence_ffmpeg(ctx.voiceover_path, self.config.ffmpeg_path)
+                await await_with_timeout(
+                    trim_silence_ffmpeg_async(ctx.voiceover_path, self._ffmpeg_path),
+                    self.timeout,
+                    "trim_silence",
+                )
             except Exception as e:  # pragma: no cover - runtime warnings
                 self.logger.warning(f"trim_silence failed: {e}")
 
-    def _generate_subtitles(
+    async def _generate_subtitles(
         self,
         ctx: PipelineContext,
         script_text: str,
@@ -141,79 +256,115 @@ class VideoPipeline:
         """Create subtitles for the video if enabled."""
 
         if no_subtitles:
-            ctx.subtitles_path = ctx.output_dir / "subtitles.ass"
-            ctx.subtitles_path.write_text("")
+            ctx.has_subtitles = False
             self.logger.info("Subtitles disabled")
             return
 
         self.logger.info("[2/3] Generating subtitles")
-        subs = SubtitleGenerator(
-            ctx.subtitle_style,
-            model=self.config.whisper_model,
-            log_file=ctx.log_file,
-            debug=self.debug,
-        )
+        subs = self._subtitle_generator(ctx)
         try:
             if whisper_disable:
                 self.logger.info("Whisper disabled; generating basic subtitles")
-                words = [
-                    {"start": i * 0.5, "end": (i + 1) * 0.5, "text": w}
-                    for i, w in enumerate(script_text.split())
-                ]
-            else:
-                words = run_with_timeout(subs.transcribe, self.timeout, ctx.voiceover_path)
-            run_with_timeout(subs.generate_ass, self.timeout, words, ctx.subtitles_path)
-        except Exception as e:
-            self.logger.error(f"Subtitle step failed: {e}")
-            if self.config.developer_mode:
-                create_dummy_subtitles(ctx.subtitles_path)
-                self.logger.warning("Developer mode: using dummy subtitles")
+                words = subs.words_from_text(script_text)
             else:
+                words = await await_with_timeout(
+                    self._in_thread(subs.transcribe, ctx.voiceover_path),
+                    self.timeout,
+                    "transcribe",
+                )
+            await await_with_timeout(
+                self._in_thread(subs.generate_ass, words, ctx.subtitles_path),
+                self.timeout,
+                "generate_ass",
+            )
+            ctx.subtitle_words = words
+        except TimeoutError as e:
+            self.logger.error("Subtitle step timed out: %s", e)
+            if not self.config.developer_mode:
+                raise
+            self._dummy_subtitles(ctx)
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            self._log_step_failure("Subtitle", e)
+            if not self.config.developer_mode:
                 raise
+            self._dummy_subtitles(ctx)
 
-    def _render_video(
+    def _log_step_failure(self, step: str, e: Exception) -> None:
+        """Log a failed *step*, with the tail of ffmpeg's stderr if present."""
+
+        self.logger.error("%s step failed: %s", step, e)
+        stderr = getattr(e, "stderr", None)
+        if stderr:
+            self.logger.error("%s stderr: %s", step, stderr[-STDERR_TAIL:])
+
+    def _silent_voiceover(self, ctx: PipelineContext) -> None:
+        """Developer-mode fallback: replace the voiceover with silence."""
+
+        from .helpers import create_silence
+
+        create_silence(ctx.voiceover_path)
+        self.logger.warning("Developer mode: using silent audio")
+
+    def _dummy_subtitles(self, ctx: PipelineContext) -> None:
+        """Developer-mode fallback: write placeholder subtitles."""
+
+        from .helpers import create_dummy_subtitles
+
+        create_dummy_subtitles(ctx.subtitles_path)
+        self.logger.warning("Developer mode: using dummy subtitles")
+
+    def _prepare_renderer(
+        self, ctx: PipelineContext, bg_folder: Path, backgrounds: list[Path]
+    ) -> VideoRenderer:
+        """Create the renderer, resolving the background folder."""
+
+        return VideoRenderer(
+            bg_folder,
+            self._watermark_path,
+            self.config.watermark_opacity,
+            resolution=self.config.resolution,
+            ffmpeg_path=self._ffmpeg_path,
+            debug=self.debug,
+            video_codec=self._hw_encoder,
+            subtitle_font=self._subtitle_font,
+            backgrounds=backgrounds,
+        )
+
+    async def _render_video(
         self,
         ctx: PipelineContext,
-        bg_folder: Path,
+        renderer: VideoRenderer,
         intro: Path | None,
         outro: Path | None,
-        no_subtitles: bool,
         crop_safe: bool,
         summary_overlay: bool,
     ) -> None:
         """Render the final video using FFmpeg."""
 
         self.logger.info("[3/3] Rendering video")
-        watermark_path = (
-            Path(self.config.watermark_path)
-            if self.config.watermark_enabled and self.config.watermark_path
-            else None
-        )
-        renderer = VideoRenderer(
-            bg_folder,
-            watermark_path,
-            self.config.watermark_opacity,
-            resolution=self.config.resolution,
-            ffmpeg_path=self.config.ffmpeg_path,
-            log_file=ctx.log_file,
-            debug=self.debug,
-        )
-        run_with_timeout(
-            renderer.render,
+        await await_with_timeout(
+            renderer.render_async(
+                ctx.voiceover_path,
+                ctx.subtitles_path if ctx.has_subtitles else None,
+                ctx.final_video_path,
+                intro,
+                outro,
+                crop_safe=crop_safe,
+                overlay_text=ctx.script_name if summary_overlay else None,
+                # only the plain style can be drawn without libass
+                words=ctx.subtitle_words if ctx.subtitle_style == "simple" else None,
+            ),
             self.timeout,
-            ctx.voiceover_path,
-            None if no_subtitles else ctx.subtitles_path,
-            ctx.final_video_path,
-            intro,
-            outro,
-            crop_safe=crop_safe,
-            overlay_text=ctx.script_name if summary_overlay else None,
+            "render",
         )
 
-    def _archive_outputs(self, ctx: PipelineContext, status: str, start: float) -> None:
+    def _archive_outputs(self, ctx: PipelineContext, status: str, start_ns: int) -> None:
         """Write session metadata and archive outputs."""
 
-        duration = f"{int(time.time() - start)}s"
+        if self._session_log:
+            self._session_log.detach()
+            self._session_log = None
+        duration = f"{(time.perf_counter_ns() - start_ns) // 10**9}s"
         ctx.save_metadata(status=status)
         run_summary = {
             "script": ctx.script_path.name,
@@ -222,12 +373,67 @@ class VideoPipeline:
             "duration": duration,
             "success": status == "success",
         }
-        with open(ctx.output_dir / "run_summary.json", "w") as f:
-            json.dump(run_summary, f, indent=2)
-        ctx.save_config_snapshot(self.config.__dict__)
+        write_json(ctx.output_dir / "run_summary.json", run_summary)
+        ctx.save_config_snapshot(asdict(self.config))
         ctx.write_summary()
         ctx.archive()
 
+    async def _run_async(
+        self,
+        ctx: PipelineContext,
+        bg_folder: Path,
+        background: str | None,
+        force_coqui: bool,
+        whisper_disable: bool,
+        no_subtitles: bool,
+        intro: Path | None,
+        outro: Path | None,
+        trim_silence: bool,
+        crop_safe: bool,
+        summary_overlay: bool,
+    ) -> None:
+        """Run the pipeline stages, overlapping the independent ones."""
+
+        # Media download and script-based subtitles do not depend on the
+        # voiceover, so they run while the voiceover is generated.
+        media = asyncio.ensure_future(self._download_media(background))
+        pending: list[asyncio.Future] = []
+        subs: asyncio.Future | None = None
+        if whisper_disable or no_subtitles:
+            subs = asyncio.ensure_future(
+                self._generate_subtitles(ctx, ctx.script_text, whisper_disable, no_subtitles)
+            )
+            pending.append(subs)
+        try:
+            await self._generate_voiceover(ctx, force_coqui, trim_silence)
+
+            if subs is None:
+                subs = asyncio.ensure_future(
+                    self._generate_subtitles(ctx, ctx.script_text, whisper_disable, no_subtitles)
+                )
+                pending.append(subs)
+            backgrounds: list[Path] = []
+            try:
+                backgrounds = await await_with_timeout(media, self.timeout, "download")
+            except TimeoutError as e:
+                self.logger.warning(f"Background prefetch abandoned: {e}; using {bg_folder}")
+            renderer = self._in_thread(self._prepare_renderer, ctx, bg_folder, backgrounds)
+            pending.append(renderer)
+            await asyncio.gather(subs, renderer)
+            await self._render_video(
+                ctx,
+                renderer.result(),
+                intro,
+                outro,
+                crop_safe,
+                summary_overlay,
+            )
+        finally:
+            # downloads go through a ``.part`` file, so an abandoned one never
+            # leaves a partial video; the other stages finish before archiving
+            media.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     def run(
         self,
         script_text: str,
@@ -247,25 +453,30 @@ class VideoPipeline:
 
         status = "success"
         ctx: PipelineContext | None = None
-        start = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             ctx, bg_folder = self._setup_context(
                 script_text, script_name, background, output, force_coqui
             )
             self.logger.info("Starting pipeline")
 
-            self._download_media(ctx)
-            self._generate_voiceover(ctx, force_coqui, trim_silence)
-            self._generate_subtitles(ctx, script_text, whisper_disable, no_subtitles)
-            self._render_video(
-                ctx,
-                bg_folder,
-                intro,
-                outro,
-                no_subtitles,
-                crop_safe,
-                summary_overlay,
+            asyncio.run(
+                self._run_async(
+                    ctx,
+                    bg_folder,
+                    background,
+                    force_coqui,
+                    whisper_disable,
+                    no_subtitles,
+                    intro,
+                    outro,
+                    trim_silence,
+                    crop_safe,
+                    summary_overlay,
+                )
             )
+            # logged before archiving detaches the session log
+            self.logger.info(f"Pipeline completed. Video at {ctx.final_video_path}")
         except Exception as e:
             status = "failed"
             self.logger.error(f"Pipeline failed: {e}")
@@ -275,7 +486,6 @@ class VideoPipeline:
             raise
         finally:
             if ctx:
-                self._archive_outputs(ctx, status, start)
+                self._archive_outputs(ctx, status, start_ns)
 
-        self.logger.info(f"Pipeline completed. Video at {ctx.final_video_path}")
         return ctx
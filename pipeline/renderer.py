@@ -1,13 +1,111 @@
 from __future__ import annotations
 
+import asyncio
 import random
+import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import shutil
 import tempfile
 
 from .logger import setup_logger
+from .helpers import FAST_SPAWN, resolve_executable, run_process_async
+from . import subtitles as ass
+
+
+# Hardware H.264 encoders in order of preference: decode flags placed before
+# the background input and encoder flags placed before the output.
+HW_ENCODER_PROFILES: dict[str, tuple[list[str], list[str]]] = {
+    "h264_nvenc": (
+        ["-hwaccel", "cuda"],
+        ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq", "-b:v", "6M"],
+    ),
+    "h264_qsv": (
+        [],
+        ["-c:v", "h264_qsv", "-preset", "medium", "-b:v", "6M"],
+    ),
+}
+
+
+# Short word-level subtitles are drawn with drawtext rather than libass,
+# which skips the libass/fontconfig start-up on short clips. drawtext does
+# not wrap lines, so longer entries stay on the ASS path. It is only used
+# when a font file for the ASS style's font is available.
+DRAWTEXT_MAX_WORDS = 200
+DRAWTEXT_MAX_CHARS = 32
+SUBTITLE_FONT_CANDIDATES = (
+    "C:/Windows/Fonts/arial.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/usr/share/fonts/truetype/msttcorefonts/Arial.ttf",
+    "/usr/share/fonts/truetype/msttcorefonts/arial.ttf",
+    "/usr/share/fonts/TTF/arial.ttf",
+)
+
+
+def find_subtitle_font(override: Path | None = None) -> Path | None:
+    """Return a font file for the ASS style font, preferring *override*."""
+    candidates = [override] if override else []
+    candidates += [Path(c) for c in SUBTITLE_FONT_CANDIDATES]
+    for cand in candidates:
+        if cand.is_file():
+            return cand
+    return None
+
+
+def _escape_drawtext(text: str) -> str:
+    """Quote *text* for use as a drawtext value inside a filter graph."""
+    text = re.sub(r"([\\':])", r"\\\1", text)
+    return "'" + text.replace("'", r"'\''") + "'"
+
+
+@lru_cache(maxsize=None)
+def detect_hw_encoder(ffmpeg_path: str = "ffmpeg") -> str | None:
+    """Return the first hardware encoder that can actually encode, or ``None``.
+
+    ffmpeg builds commonly list NVENC/QSV without the hardware being present,
+    so each listed candidate is test-encoded on a single synthetic frame.
+    """
+    exe = resolve_executable(ffmpeg_path)
+    if not exe:
+        return None
+    try:
+        listing = subprocess.run(
+            [exe, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            **FAST_SPAWN,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    for encoder, (_, out_args) in HW_ENCODER_PROFILES.items():
+        if encoder not in listing:
+            continue
+        probe = [
+            exe,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=size=256x256:duration=0.1",
+            "-frames:v",
+            "1",
+            *out_args,
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            result = subprocess.run(probe, capture_output=True, timeout=10, **FAST_SPAWN)
+            if result.returncode == 0:
+                return encoder
+        except (OSError, subprocess.SubprocessError):
+            continue
+    return None
 
 
 class VideoRenderer:
@@ -21,16 +119,28 @@ class VideoRenderer:
         ffmpeg_path: str = "ffmpeg",
         log_file: Optional[Path] = None,
         debug: bool = False,
+        video_codec: str | None = None,
+        subtitle_font: Path | None = None,
+        backgrounds: list[Path] | None = None,
     ):
         self.logger = setup_logger("renderer", log_file, debug)
         self.bg_root = bg_folder.parent
-        self.bg_folder = self._resolve_folder(bg_folder)
+        # explicit videos (e.g. prefetched downloads) take precedence over the folder
+        self.backgrounds = list(backgrounds or [])
+        self.bg_folder = bg_folder if self.backgrounds else self._resolve_folder(bg_folder)
         self.watermark = watermark if watermark and watermark.exists() else None
         self.opacity = opacity
         self.resolution = resolution
-        self.ffmpeg = ffmpeg_path
-        if not shutil.which(self.ffmpeg):
-            self.logger.warning(f"ffmpeg executable '{self.ffmpeg}' not found")
+        self.subtitle_font = find_subtitle_font(subtitle_font)
+        # resolved once per process so every launch skips the PATH search
+        exe = resolve_executable(ffmpeg_path)
+        if not exe:
+            self.logger.warning(f"ffmpeg executable '{ffmpeg_path}' not found")
+        self.ffmpeg = exe or ffmpeg_path
+        # ``None`` keeps ffmpeg's default software encoder
+        self.hwaccel_args, self.codec_args = HW_ENCODER_PROFILES.get(video_codec, ([], []))
+        if video_codec in HW_ENCODER_PROFILES:
+            self.logger.info(f"Using hardware encoder {video_codec}")
 
     def _list_videos(self, folder: Path) -> list[Path]:
         return [p for p in folder.glob("*") if p.suffix.lower() in {".mp4", ".webm"}]
@@ -83,7 +193,7 @@ class VideoRenderer:
         raise FileNotFoundError(f"No background videos found in {root}")
 
     def pick_background(self) -> Path:
-        videos = self._list_videos(self.bg_folder)
+        videos = self.backgrounds or self._list_videos(self.bg_folder)
         if not videos:
             self.logger.error(f"No background videos found in {self.bg_folder}")
             raise FileNotFoundError("No background videos found")
@@ -91,6 +201,45 @@ class VideoRenderer:
         self.logger.info(f"Selected background video {choice}")
         return choice
 
+    def _drawtext_filter(self, words: list[dict] | None) -> str | None:
+        """Return a drawtext chain for *words*, or ``None`` to use libass.
+
+        Size and margin are scaled to the frame height the way libass scales
+        the ASS style, so both paths render the "simple" style alike.
+        """
+        if not self.subtitle_font or not words or len(words) >= DRAWTEXT_MAX_WORDS:
+            return None
+        texts = [w.get("text", "").strip() for w in words]
+        if any(len(t) > DRAWTEXT_MAX_CHARS for t in texts):
+            return None
+        # borderw takes no expression; use the configured output height
+        height = int(self.resolution.split("x")[1])
+        border = max(1, round(ass.OUTLINE * height / ass.PLAY_RES_Y))
+        style = (
+            f"fontfile={_escape_drawtext(self.subtitle_font.as_posix())}:expansion=none"
+            f":fontcolor=white:fontsize=h*{ass.FONT_SIZE}/{ass.PLAY_RES_Y}"
+            f":borderw={border}:bordercolor=black:x=(w-text_w)/2"
+            f":y=h-text_h-h*{ass.MARGIN_V}/{ass.PLAY_RES_Y}"
+        )
+        parts = [
+            f"drawtext=text={_escape_drawtext(text)}:{style}"
+            f":enable='between(t,{w['start']:.2f},{w['end']:.2f})'"
+            for w, text in zip(words, texts)
+            if text
+        ]
+        return ",".join(parts) or None
+
+    @staticmethod
+    def _filter_args(option: str, graph: str, script_dir: Path | None) -> list[str]:
+        """Return *option* for *graph*, passed via a script file when *script_dir* is set."""
+        if script_dir is None:
+            return [option, graph]
+        script = script_dir / "filters.txt"
+        script.write_text(graph)
+        if option == "-filter_complex":
+            return ["-filter_complex_script", script.as_posix()]
+        return ["-filter_script:v", script.as_posix()]
+
     def render(
         self,
         audio_path: Path,
@@ -100,12 +249,42 @@ class VideoRenderer:
         outro: Path | None = None,
         crop_safe: bool = False,
         overlay_text: str | None = None,
+        words: list[dict] | None = None,
+    ):
+        """Render the final video using *audio_path* and optional *subtitles*.
+
+        Blocking wrapper around :meth:`render_async`.
+        """
+        asyncio.run(
+            self.render_async(
+                audio_path,
+                subtitles,
+                output_path,
+                intro,
+                outro,
+                crop_safe=crop_safe,
+                overlay_text=overlay_text,
+                words=words,
+            )
+        )
+
+    async def render_async(
+        self,
+        audio_path: Path,
+        subtitles: Path | None,
+        output_path: Path,
+        intro: Path | None = None,
+        outro: Path | None = None,
+        crop_safe: bool = False,
+        overlay_text: str | None = None,
+        words: list[dict] | None = None,
     ):
         """Render the final video using *audio_path* and optional *subtitles*.
 
         Automatically switches to ``-filter_complex`` when a watermark and
         subtitles are both present. All paths are converted to POSIX style to
-        avoid Windows escaping issues.
+        avoid Windows escaping issues. When short *words* timings are given
+        they are drawn with ``drawtext`` instead of loading *subtitles*.
         """
         self.logger.info("Starting FFmpeg render")
 
@@ -142,11 +321,20 @@ class VideoRenderer:
         subs = subtitles.as_posix() if subtitles and subtitles.exists() else None
         wm = self.watermark.as_posix() if self.watermark else None
 
-        base_cmd = [self.ffmpeg, "-y", "-i", bg, "-i", audio]
+        base_cmd = [self.ffmpeg, "-y", *self.hwaccel_args, "-i", bg, "-i", audio]
+
+        drawtext = self._drawtext_filter(words) if subs else None
+        subs_filter = drawtext or (f"subtitles='{subs}'" if subs else None)
+
+        temp_dir = None
+        if intro or outro or drawtext:
+            temp_dir = tempfile.TemporaryDirectory()
+        # long drawtext chains go through a script file to avoid argv limits
+        script_dir = Path(temp_dir.name) if drawtext else None
 
         # Determine filters
-        if subs and wm:
-            fc = [f"[0:v]subtitles='{subs}'[vsubs]"]
+        if subs_filter and wm:
+            fc = [f"[0:v]{subs_filter}[vsubs]"]
             fc.append(f"movie={wm}[wm]")
             chain = "[vsubs][wm]overlay=W-w-10:H-h-10"
             if crop_safe:
@@ -159,9 +347,7 @@ class VideoRenderer:
             chain += ",format=yuv420p[v]"
             fc.append(chain)
             filter_complex = ";".join(fc)
-            cmd = base_cmd + [
-                "-filter_complex",
-                filter_complex,
+            cmd = base_cmd + self._filter_args("-filter_complex", filter_complex, script_dir) + [
                 "-map",
                 "[v]",
                 "-map",
@@ -169,8 +355,8 @@ class VideoRenderer:
             ]
         else:
             vf_parts = []
-            if subs:
-                vf_parts.append(f"subtitles='{subs}'")
+            if subs_filter:
+                vf_parts.append(subs_filter)
             if wm:
                 vf_parts.append(
                     "movie="
@@ -187,25 +373,23 @@ class VideoRenderer:
                 )
                 vf_parts.append(draw)
             vf_parts.append("format=yuv420p")
-            vf = ";".join(vf_parts) if wm and not subs else ",".join(vf_parts)
-            cmd = base_cmd + ["-vf", vf]
+            vf = ";".join(vf_parts) if wm and not subs_filter else ",".join(vf_parts)
+            cmd = base_cmd + self._filter_args("-vf", vf, script_dir)
 
-        temp_dir = None
         main_output = output_path
         if intro or outro:
-            temp_dir = tempfile.TemporaryDirectory()
             main_output = Path(temp_dir.name) / "main.mp4"
 
-        cmd += ["-s", self.resolution, main_output.as_posix()]
+        cmd += [*self.codec_args, "-s", self.resolution, main_output.as_posix()]
 
         self.logger.debug("FFmpeg command: " + " ".join(cmd))
 
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            if result.stdout:
-                self.logger.debug(result.stdout)
-            if result.stderr:
-                self.logger.debug(result.stderr)
+            stdout, stderr = await run_process_async(cmd)
+            if stdout:
+                self.logger.debug(stdout)
+            if stderr:
+                self.logger.debug(stderr)
         except subprocess.CalledProcessError as e:
             self.logger.error(f"ffmpeg failed: {e.stderr}")
             raise
@@ -235,11 +419,13 @@ class VideoRenderer:
                 output_path.as_posix(),
             ]
             try:
-                subprocess.run(cmd2, check=True)
+                await run_process_async(cmd2)
             finally:
                 main_output.unlink(missing_ok=True)
                 concat.unlink(missing_ok=True)
                 temp_dir.cleanup()
+        elif temp_dir is not None:
+            temp_dir.cleanup()
 
         self.logger.info(f"Render complete: {output_path}")
 
@@ -7,6 +7,14 @@ import json
 from .logger import setup_logger
 from .helpers import create_dummy_subtitles
 
+# Default ASS style. The script sets no PlayResY, so libass lays it out on
+# its 288-line default canvas and scales it to the video height.
+FONT_NAME = "Arial"
+FONT_SIZE = 48
+MARGIN_V = 10
+OUTLINE = 2
+PLAY_RES_Y = 288
+
 
 class SubtitleGenerator:
     """Generate subtitles using Whisper and export to ASS format."""
@@ -14,6 +22,7 @@ class SubtitleGenerator:
         self.style = style
         self.model_name = model
         self.logger = setup_logger("subtitles", log_file, debug)
+        self._model = None
 
     def transcribe(self, audio_path: Path) -> List[dict]:
         """Use whisper to transcribe audio to words with timestamps."""
@@ -26,12 +35,27 @@ class SubtitleGenerator:
         except Exception as e:
             self.logger.error(f"Whisper not available: {e}")
             return []
-        model = whisper.load_model(self.model_name)
-        result = model.transcribe(str(audio_path), word_timestamps=True)
+        if self._model is None:
+            self._model = whisper.load_model(self.model_name)
+        result = self._model.transcribe(str(audio_path), word_timestamps=True)
         words = result.get("segments", [])
         self.logger.info(f"Transcription complete: {len(words)} segments")
         return words
 
+    @staticmethod
+    def words_from_text(text: str, step: float = 0.5) -> List[dict]:
+        """Return evenly spaced word timings for *text* without transcription."""
+        tokens = text.split()
+        bounds = [i * step for i in range(len(tokens) + 1)]
+        return [
+            {"start": start, "end": end, "text": tok}
+            for start, end, tok in zip(bounds, bounds[1:], tokens)
+        ]
+
+    def close(self) -> None:
+        """Release the loaded Whisper model."""
+        self._model = None
+
     def generate_ass(self, words: List[dict], output_path: Path):
         self.logger.info(f"Generating {self.style} subtitles")
         if not words:
@@ -45,15 +69,18 @@ class SubtitleGenerator:
                 "[V4+ Styles]\nFormat: Name, Fontname, Fontsize, PrimaryColour, BackColour, OutlineColour, Bold, Italic, Alignment, MarginL, MarginR, MarginV, BorderStyle, Outline, Shadow, Encoding\n"
             )
             f.write(
-                "Style: Default,Arial,48,&H00FFFFFF,&H00000000,&H00000000,0,0,2,10,10,10,1,2,0,0\n"
+                f"Style: Default,{FONT_NAME},{FONT_SIZE},&H00FFFFFF,&H00000000,&H00000000,"
+                f"0,0,2,10,10,{MARGIN_V},1,{OUTLINE},0,0\n"
             )
             f.write("[Events]\nFormat: Start, End, Style, Text\n")
-            for w in words:
-                start = self._format_time(w["start"])
-                end = self._format_time(w["end"])
-                text = w.get("text", "").strip()
-                line = f"Dialogue: 0,{start},{end},Default,{self._style_tag(text)}\n"
-                f.write(line)
+            fmt, tag = self._format_time, self._style_tag
+            f.write(
+                "".join(
+                    f"Dialogue: 0,{fmt(w['start'])},{fmt(w['end'])},Default,"
+                    f"{tag(w.get('text', '').strip())}\n"
+                    for w in words
+                )
+            )
         self.logger.info(f"Subtitles written to {output_path}")
 
     def _style_tag(self, text: str) -> str:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import wave
 try:
     import requests
 except Exception:  # pragma: no cover - missing dependency in tests
@@ -16,6 +17,18 @@ from .logger import setup_logger
 
 load_dotenv()
 
+# ElevenLabs raw PCM output: 16-bit mono at this sample rate
+ELEVENLABS_SAMPLE_RATE = 24000
+
+# loaded Coqui models by name; the model does not depend on the voice, so
+# generators for different voices share one copy
+_COQUI_MODELS: dict[str, object] = {}
+
+
+def release_coqui_models() -> None:
+    """Drop the shared Coqui models so their memory can be reclaimed."""
+    _COQUI_MODELS.clear()
+
 
 class VoiceOverGenerator:
     """Create voiceovers via ElevenLabs or Coqui TTS."""
@@ -33,6 +46,7 @@ class VoiceOverGenerator:
         self.coqui_model_name = coqui_model_name or "tts_models/en/ljspeech/tacotron2-DDC"
         self.force_coqui = force_coqui
         self.logger = setup_logger("voiceover", log_file, debug)
+        self._tts = None
         self.api_key = os.getenv("ELEVENLABS_API_KEY")
         self.voice_id = voice_id or os.getenv("ELEVENLABS_VOICE_ID")
 
@@ -70,49 +84,79 @@ class VoiceOverGenerator:
         url = f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}"
         headers = {"xi-api-key": self.api_key}
         payload = {"text": text}
+        params = {"output_format": f"pcm_{ELEVENLABS_SAMPLE_RATE}"}
         for attempt in range(3):
             try:
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
-                if response.status_code == 200:
-                    output_path.write_bytes(response.content)
-                    self.logger.info("ElevenLabs voiceover generated successfully")
-                    return True
-                self.logger.error(
-                    f"ElevenLabs API error {response.status_code}: {response.text}"
-                )
-                if response.status_code == 404:
-                    self.logger.error("ElevenLabs voice ID not found")
-                    self._list_voices()
-                if response.status_code >= 500:
-                    continue
-                return False
+                with requests.post(
+                    url, json=payload, headers=headers, params=params, timeout=30, stream=True
+                ) as response:
+                    if response.status_code == 200:
+                        self._write_pcm_stream(response, output_path)
+                        self.logger.info("ElevenLabs voiceover generated successfully")
+                        return True
+                    self.logger.error(
+                        f"ElevenLabs API error {response.status_code}: {response.text}"
+                    )
+                    if response.status_code == 404:
+                        self.logger.error("ElevenLabs voice ID not found")
+                        self._list_voices()
+                    if response.status_code >= 500:
+                        continue
+                    return False
             except Exception as e:
                 self.logger.error(f"ElevenLabs request failed: {e}")
                 if attempt == 2:
                     return False
         return False
 
-    def _generate_coqui(self, text: str, output_path: Path) -> bool:
-        self.logger.info("Using Coqui TTS")
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _write_pcm_stream(response, output_path: Path) -> None:
+        """Write streamed raw PCM from *response* straight into a WAV file."""
+        with wave.open(str(output_path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(ELEVENLABS_SAMPLE_RATE)
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                wf.writeframesraw(chunk)
+
+    def _load_coqui(self):
+        """Return the shared Coqui TTS model, loading it on first use."""
+        if self._tts is not None:
+            return self._tts
+        self._tts = _COQUI_MODELS.get(self.coqui_model_name)
+        if self._tts is not None:
+            return self._tts
         try:
             from TTS.api import TTS
             from TTS.utils.manage import ModelManager
         except Exception as e:  # fallback import error or runtime
             self.logger.error(f"Coqui TTS not available: {e}")
-            return False
+            return None
 
         try:
-            tts = TTS(model_name=self.coqui_model_name)
+            self._tts = TTS(model_name=self.coqui_model_name)
         except Exception:
             self.logger.info("Downloading Coqui TTS model...")
             manager = ModelManager()
             try:
                 manager.download_model(self.coqui_model_name)
-                tts = TTS(model_name=self.coqui_model_name)
+                self._tts = TTS(model_name=self.coqui_model_name)
             except Exception as e:
                 self.logger.error(f"Coqui TTS download failed: {e}")
-                return False
+                return None
+        _COQUI_MODELS[self.coqui_model_name] = self._tts
+        return self._tts
+
+    def close(self) -> None:
+        """Drop this generator's reference to the shared Coqui model."""
+        self._tts = None
+
+    def _generate_coqui(self, text: str, output_path: Path) -> bool:
+        self.logger.info("Using Coqui TTS")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tts = self._load_coqui()
+        if tts is None:
+            return False
 
         try:
             tts.tts_to_file(text=text, file_path=str(output_path))
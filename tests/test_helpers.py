@@ -0,0 +1,86 @@
+import asyncio
+import os
+import shutil
+import sys
+import wave
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from pipeline import helpers
+from pipeline.helpers import (
+    MAX_NAME_LENGTH,
+    create_silence,
+    is_valid_wav,
+    run_process_async,
+    sanitize_name,
+    zip_folder,
+)
+
+
+def test_zip_folder_stores_compressed_media(tmp_path):
+    folder = tmp_path / "session"
+    (folder / "logs").mkdir(parents=True)
+    (folder / "final_video.mp4").write_bytes(b"\x00" * 4096)
+    (folder / "logs" / "pipeline.log").write_text("line\n" * 200)
+
+    archive = zip_folder(folder, folder)
+
+    assert archive == tmp_path / "session.zip"
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        assert zf.getinfo("final_video.mp4").compress_type == zipfile.ZIP_STORED
+        log = zf.getinfo("logs/pipeline.log")
+        assert log.compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read("logs/pipeline.log") == b"line\n" * 200
+
+
+def test_sanitize_name_replaces_unsafe_characters():
+    assert sanitize_name(" My Story! ") == "My_Story_"
+    assert sanitize_name("caf\u00e9-1_2") == "caf_-1_2"
+    assert sanitize_name("   ") == "session"
+
+
+def test_sanitize_name_caps_length():
+    assert len(sanitize_name("a" * 200)) == MAX_NAME_LENGTH == 128
+
+
+def test_is_valid_wav_accepts_audio(tmp_path):
+    path = tmp_path / "voice.wav"
+    create_silence(path, duration=0.1)
+    assert is_valid_wav(path)
+
+
+def test_is_valid_wav_rejects_header_only(tmp_path):
+    path = tmp_path / "voice.wav"
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(24000)
+    assert path.stat().st_size == 44
+    assert not is_valid_wav(path)
+
+
+def test_is_valid_wav_rejects_non_wav_and_missing(tmp_path):
+    mp3 = tmp_path / "voice.wav"
+    mp3.write_bytes(b"ID3" + b"\x00" * 200)
+    assert not is_valid_wav(mp3)
+    assert not is_valid_wav(tmp_path / "missing.wav")
+
+
+@pytest.mark.skipif(shutil.which("sleep") is None, reason="needs a sleep command")
+def test_run_process_async_kills_child_on_timeout(monkeypatch):
+    procs = []
+    spawn = asyncio.create_subprocess_exec
+
+    async def tracked(*args, **kwargs):
+        proc = await spawn(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(helpers.asyncio, "create_subprocess_exec", tracked)
+    with pytest.raises(TimeoutError, match="sleep timed out"):
+        asyncio.run(run_process_async(["sleep", "5"], timeout=0.2))
+    assert procs[0].returncode is not None and procs[0].returncode < 0
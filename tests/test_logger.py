@@ -0,0 +1,22 @@
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from pipeline.logger import SESSION_LOGGERS, SessionLog, setup_logger, start_queue_logging, stop_queue_logging
+
+
+def test_session_handlers_keep_console_output(tmp_path, monkeypatch, capsys):
+    for name in SESSION_LOGGERS:
+        monkeypatch.setattr(logging.getLogger(name), "handlers", [])
+    handler, listener = start_queue_logging(tmp_path / "clipjar.log")
+    session = SessionLog(tmp_path / "pipeline.log", "demo")
+    try:
+        logger = setup_logger("renderer", tmp_path / "renderer.log")
+        logger.info("rendering demo")
+    finally:
+        session.detach()
+        stop_queue_logging(handler, listener)
+    assert "rendering demo" in capsys.readouterr().err
+    assert "rendering demo" in (tmp_path / "pipeline.log").read_text()
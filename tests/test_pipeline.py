@@ -0,0 +1,312 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from pipeline import pipeline as pl
+from pipeline.config import Config
+from pipeline.helpers import create_silence, is_valid_wav
+
+
+def _pipeline(tmp_path, **overrides):
+    settings = {
+        "background_videos_path": str(tmp_path / "backgrounds"),
+        "background_cache_dir": str(tmp_path / "cache"),
+        "background_urls": {"remote": ["https://example.com/clip.mp4"]},
+        "hardware_encoding": False,
+        "log_file": str(tmp_path / "logs" / "clipjar.log"),
+    }
+    config = Config(**{**settings, **overrides})
+    return pl.VideoPipeline(config)
+
+
+def _fail_download(url, cache_dir):
+    raise OSError("network down")
+
+
+def _fake_download(url, cache_dir):
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    dest = cache_dir / f"{url.rsplit('/', 1)[-1]}"
+    dest.write_bytes(b"\x00")
+    return dest
+
+
+def test_failed_download_returns_no_videos(tmp_path, monkeypatch):
+    monkeypatch.setattr(pl, "download_cached", _fail_download)
+    pipe = _pipeline(tmp_path)
+    try:
+        videos = asyncio.run(pipe._download_media("remote"))
+    finally:
+        pipe.close()
+    assert videos == []
+
+
+def test_download_returns_only_configured_videos(tmp_path, monkeypatch):
+    monkeypatch.setattr(pl, "download_cached", _fake_download)
+    stale = tmp_path / "cache" / "removed.mp4"
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b"\x00")
+    pipe = _pipeline(tmp_path)
+    try:
+        videos = asyncio.run(pipe._download_media("Remote"))
+    finally:
+        pipe.close()
+    assert videos == [tmp_path / "cache" / "clip.mp4"]
+
+
+def test_styles_share_the_flat_cache(tmp_path, monkeypatch):
+    seen = []
+
+    def record(url, cache_dir):
+        seen.append(cache_dir)
+        return _fake_download(url, cache_dir)
+
+    monkeypatch.setattr(pl, "download_cached", record)
+    url = "https://example.com/clip.mp4"
+    pipe = _pipeline(tmp_path, background_urls={"rain": [url], "storm": [url]})
+    try:
+        rain = asyncio.run(pipe._download_media("rain"))
+        storm = asyncio.run(pipe._download_media("storm"))
+    finally:
+        pipe.close()
+    assert rain == storm
+    assert seen == [tmp_path / "cache", tmp_path / "cache"]
+
+
+def test_failed_download_renders_from_local_style(tmp_path, monkeypatch):
+    monkeypatch.setattr(pl, "download_cached", _fail_download)
+    local = tmp_path / "backgrounds" / "rain"
+    local.mkdir(parents=True)
+    (local / "local.mp4").write_bytes(b"\x00")
+    pipe = _pipeline(tmp_path, background_styles={"Remote": str(local)})
+    try:
+        ctx, bg_folder = pipe._setup_context("hi", "cli", "remote", tmp_path / "out.mp4", False)
+        videos = asyncio.run(pipe._download_media("remote"))
+        renderer = pipe._prepare_renderer(ctx, bg_folder, videos)
+    finally:
+        pipe._session_log.detach()
+        pipe.close()
+    assert renderer.pick_background() == (local / "local.mp4").resolve()
+
+
+class _SilentVoice:
+    """Stub generator that writes nothing, so the voiceover is invalid."""
+
+    def generate(self, text, path):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_stage_failure_does_not_wait_for_downloads(tmp_path, monkeypatch):
+    def slow_download(url, cache_dir):
+        time.sleep(2)
+
+    monkeypatch.setattr(pl, "download_cached", slow_download)
+    monkeypatch.chdir(tmp_path)
+    pipe = _pipeline(tmp_path, step_timeout=5)
+    monkeypatch.setattr(pipe, "_voice_generator", lambda ctx, force_coqui: _SilentVoice())
+    start = time.monotonic()
+    try:
+        with pytest.raises(RuntimeError, match="voiceover file invalid"):
+            pipe.run("hi", "demo", background="remote", output=tmp_path / "out" / "final.mp4")
+    finally:
+        pipe.close()
+    assert time.monotonic() - start < 1
+
+
+class _Voice:
+    """Stub generator writing a valid WAV after *before* runs."""
+
+    def __init__(self, before=lambda: None):
+        self.before = before
+
+    def generate(self, text, path):
+        self.before()
+        create_silence(path, 0.1)
+
+    def close(self):
+        pass
+
+
+class _Subs:
+    """Stub subtitle generator; *transcribe* runs before the words are returned."""
+
+    def __init__(self, transcribe=lambda: None):
+        self._transcribe = transcribe
+
+    def words_from_text(self, text):
+        return [{"start": 0.0, "end": 0.5, "text": text}]
+
+    def transcribe(self, path):
+        self._transcribe()
+        return self.words_from_text("hi")
+
+    def generate_ass(self, words, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("[Script Info]\n")
+
+    def close(self):
+        pass
+
+
+def _stub_stages(pipe, monkeypatch, voice, subs, render=None):
+    async def no_render(*args):
+        pass
+
+    monkeypatch.setattr(pipe, "_voice_generator", lambda ctx, force_coqui: voice)
+    monkeypatch.setattr(pipe, "_subtitle_generator", lambda ctx: subs)
+    monkeypatch.setattr(pipe, "_prepare_renderer", lambda ctx, bg_folder, backgrounds: None)
+    monkeypatch.setattr(pipe, "_render_video", render or no_render)
+
+
+def _run(pipe, tmp_path, **kwargs):
+    return pipe.run("hi", "demo", output=tmp_path / "out" / "final.mp4", **kwargs)
+
+
+def test_subtitles_and_download_overlap_voiceover(tmp_path, monkeypatch):
+    downloaded = threading.Event()
+    subtitled = threading.Event()
+
+    def download(url, cache_dir):
+        downloaded.set()
+        return _fake_download(url, cache_dir)
+
+    class Subs(_Subs):
+        def generate_ass(self, words, path):
+            super().generate_ass(words, path)
+            subtitled.set()
+
+    def wait_for_others():
+        assert downloaded.wait(2) and subtitled.wait(2)
+
+    monkeypatch.setattr(pl, "download_cached", download)
+    monkeypatch.chdir(tmp_path)
+    pipe = _pipeline(tmp_path)
+    _stub_stages(pipe, monkeypatch, _Voice(wait_for_others), Subs())
+    try:
+        ctx = _run(pipe, tmp_path, background="remote", whisper_disable=True)
+    finally:
+        pipe.close()
+    assert ctx.subtitle_words == [{"start": 0.0, "end": 0.5, "text": "hi"}]
+
+
+def test_renderer_prepared_during_transcription(tmp_path, monkeypatch):
+    prepared = threading.Event()
+
+    def prepare(ctx, bg_folder, backgrounds):
+        prepared.set()
+
+    def transcribe():
+        assert prepared.wait(2)
+
+    monkeypatch.chdir(tmp_path)
+    pipe = _pipeline(tmp_path)
+    _stub_stages(pipe, monkeypatch, _Voice(), _Subs(transcribe))
+    monkeypatch.setattr(pipe, "_prepare_renderer", prepare)
+    try:
+        _run(pipe, tmp_path)
+    finally:
+        pipe.close()
+    assert prepared.is_set()
+
+
+def test_completion_is_written_to_session_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pipe = _pipeline(tmp_path)
+    _stub_stages(pipe, monkeypatch, _Voice(), _Subs())
+    try:
+        ctx = _run(pipe, tmp_path)
+    finally:
+        pipe.close()
+    assert "Pipeline completed" in (ctx.output_dir / "pipeline.log").read_text()
+
+
+def test_stage_timeout_raises_timeout_error(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pipe = _pipeline(tmp_path, step_timeout=0.2)
+    _stub_stages(pipe, monkeypatch, _Voice(lambda: time.sleep(0.5)), _Subs())
+    try:
+        with pytest.raises(TimeoutError, match="voiceover timed out"):
+            _run(pipe, tmp_path)
+    finally:
+        pipe.close()
+
+
+def test_render_error_propagates(tmp_path, monkeypatch):
+    async def fail_render(*args):
+        raise subprocess.CalledProcessError(1, ["ffmpeg"], "", "boom")
+
+    monkeypatch.chdir(tmp_path)
+    pipe = _pipeline(tmp_path)
+    _stub_stages(pipe, monkeypatch, _Voice(), _Subs(), render=fail_render)
+    try:
+        with pytest.raises(subprocess.CalledProcessError):
+            _run(pipe, tmp_path)
+    finally:
+        pipe.close()
+
+
+class _Raise:
+    def __init__(self, exc):
+        self.exc = exc
+
+    def __call__(self, *args):
+        raise self.exc
+
+
+@pytest.fixture
+def staged(tmp_path, monkeypatch):
+    """Return a factory for a pipeline and context whose stages raise *exc*."""
+
+    made = []
+
+    def make(exc, developer_mode):
+        pipe = _pipeline(tmp_path, developer_mode=developer_mode)
+        voice, subs = _Voice(_Raise(exc)), _Subs(_Raise(exc))
+        _stub_stages(pipe, monkeypatch, voice, subs)
+        ctx, _ = pipe._setup_context("hi", "cli", None, tmp_path / "out" / "final.mp4", False)
+        made.append(pipe)
+        return pipe, ctx
+
+    yield make
+    for pipe in made:
+        pipe._session_log.detach()
+        pipe.close()
+
+
+@pytest.mark.parametrize("exc", [TimeoutError("slow"), RuntimeError("broken")])
+def test_developer_mode_falls_back(staged, exc):
+    pipe, ctx = staged(exc, developer_mode=True)
+    asyncio.run(pipe._generate_voiceover(ctx, False, False))
+    asyncio.run(pipe._generate_subtitles(ctx, ctx.script_text, False, False))
+    assert is_valid_wav(ctx.voiceover_path)
+    assert ctx.subtitles_path.exists()
+
+
+@pytest.mark.parametrize("exc", [TimeoutError("slow"), RuntimeError("broken")])
+def test_step_errors_reraise_outside_developer_mode(staged, exc):
+    pipe, ctx = staged(exc, developer_mode=False)
+    with pytest.raises(type(exc)):
+        asyncio.run(pipe._generate_voiceover(ctx, False, False))
+    with pytest.raises(type(exc)):
+        asyncio.run(pipe._generate_subtitles(ctx, ctx.script_text, False, False))
+    assert not ctx.voiceover_path.exists()
+    assert not ctx.subtitles_path.exists()
+
+
+def test_unexpected_errors_skip_the_fallback(staged):
+    pipe, ctx = staged(OSError("disk full"), developer_mode=True)
+    with pytest.raises(OSError):
+        asyncio.run(pipe._generate_voiceover(ctx, False, False))
+    with pytest.raises(OSError):
+        asyncio.run(pipe._generate_subtitles(ctx, ctx.script_text, False, False))
+    assert not ctx.voiceover_path.exists()
+    assert not ctx.subtitles_path.exists()
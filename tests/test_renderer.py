@@ -0,0 +1,78 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from pipeline.renderer import (
+    DRAWTEXT_MAX_CHARS,
+    DRAWTEXT_MAX_WORDS,
+    VideoRenderer,
+    _escape_drawtext,
+)
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    bg = tmp_path / "backgrounds" / "rain"
+    bg.mkdir(parents=True)
+    (bg / "clip.mp4").write_bytes(b"\x00")
+    font = tmp_path / "Arial.ttf"
+    font.write_bytes(b"\x00")
+    return VideoRenderer(bg, resolution="1080x1920", subtitle_font=font)
+
+
+def _words(*texts):
+    return [{"start": i * 0.5, "end": (i + 1) * 0.5, "text": t} for i, t in enumerate(texts)]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("hello", "'hello'"),
+        ("a:b", r"'a\:b'"),
+        ("it's", r"'it\'\''s'"),
+        ("back\\slash", r"'back\\slash'"),
+        ("one, two", "'one, two'"),
+    ],
+)
+def test_escape_drawtext(text, expected):
+    assert _escape_drawtext(text) == expected
+
+
+def test_drawtext_filter_one_entry_per_word(renderer):
+    chain = renderer._drawtext_filter(_words("hi", "there"))
+    parts = chain.split(",drawtext=")
+    assert len(parts) == 2
+    assert "text='hi'" in parts[0]
+    assert "enable='between(t,0.00,0.50)'" in parts[0]
+    assert "enable='between(t,0.50,1.00)'" in parts[1]
+    # scaled like libass scales a 288-line ASS canvas to the frame
+    assert "fontsize=h*48/288" in chain
+    assert "y=h-text_h-h*10/288" in chain
+    assert "borderw=13" in chain
+    assert "fontfile='" in chain
+
+
+def test_drawtext_filter_word_limit(renderer):
+    assert renderer._drawtext_filter(_words(*["w"] * (DRAWTEXT_MAX_WORDS - 1)))
+    assert renderer._drawtext_filter(_words(*["w"] * DRAWTEXT_MAX_WORDS)) is None
+
+
+def test_drawtext_filter_length_limit(renderer):
+    assert renderer._drawtext_filter(_words("x" * DRAWTEXT_MAX_CHARS))
+    assert renderer._drawtext_filter(_words("x" * (DRAWTEXT_MAX_CHARS + 1))) is None
+
+
+def test_drawtext_filter_needs_font(renderer):
+    renderer.subtitle_font = None
+    assert renderer._drawtext_filter(_words("hi")) is None
+
+
+def test_explicit_backgrounds_override_folder(tmp_path):
+    video = tmp_path / "cache" / "abc.mp4"
+    video.parent.mkdir()
+    video.write_bytes(b"\x00")
+    renderer = VideoRenderer(tmp_path / "missing", backgrounds=[video])
+    assert renderer.pick_background() == video
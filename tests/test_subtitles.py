@@ -0,0 +1,30 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from pipeline.subtitles import SubtitleGenerator
+
+
+def test_words_from_text_uses_half_second_slots():
+    words = SubtitleGenerator.words_from_text("one  two\nthree")
+    assert words == [
+        {"start": 0.0, "end": 0.5, "text": "one"},
+        {"start": 0.5, "end": 1.0, "text": "two"},
+        {"start": 1.0, "end": 1.5, "text": "three"},
+    ]
+
+
+def test_words_from_text_empty_script():
+    assert SubtitleGenerator.words_from_text("   ") == []
+
+
+def test_generate_ass_writes_one_dialogue_per_word(tmp_path):
+    out = tmp_path / "subs.ass"
+    gen = SubtitleGenerator("simple")
+    gen.generate_ass(SubtitleGenerator.words_from_text("hello world"), out)
+    lines = [ln for ln in out.read_text().splitlines() if ln.startswith("Dialogue:")]
+    assert lines == [
+        "Dialogue: 0,0:00:00.00,0:00:00.50,Default,hello",
+        "Dialogue: 0,0:00:00.50,0:00:01.00,Default,world",
+    ]
@@ -0,0 +1,45 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from pipeline import voiceover
+from pipeline.voiceover import VoiceOverGenerator, release_coqui_models
+
+
+def _fake_tts(monkeypatch):
+    loads = []
+
+    class TTS:
+        def __init__(self, model_name):
+            loads.append(model_name)
+
+    api = types.ModuleType("TTS.api")
+    api.TTS = TTS
+    manage = types.ModuleType("TTS.utils.manage")
+    manage.ModelManager = object
+    monkeypatch.setitem(sys.modules, "TTS", types.ModuleType("TTS"))
+    monkeypatch.setitem(sys.modules, "TTS.api", api)
+    monkeypatch.setitem(sys.modules, "TTS.utils", types.ModuleType("TTS.utils"))
+    monkeypatch.setitem(sys.modules, "TTS.utils.manage", manage)
+    monkeypatch.setattr(voiceover, "_COQUI_MODELS", {})
+    return loads
+
+
+def test_voices_share_one_coqui_model(monkeypatch):
+    loads = _fake_tts(monkeypatch)
+    first = VoiceOverGenerator("coqui", "voice-a", "tts_models/en/test")
+    second = VoiceOverGenerator("coqui", "voice-b", "tts_models/en/test")
+    assert first._load_coqui() is second._load_coqui()
+    assert loads == ["tts_models/en/test"]
+
+
+def test_release_coqui_models_forces_reload(monkeypatch):
+    loads = _fake_tts(monkeypatch)
+    gen = VoiceOverGenerator("coqui", "voice-a", "tts_models/en/test")
+    gen._load_coqui()
+    gen.close()
+    release_coqui_models()
+    gen._load_coqui()
+    assert loads == ["tts_models/en/test", "tts_models/en/test"]